@@ -2,6 +2,7 @@
 #include <chrono>
 #include <ctime>
 #include <vector>
+#include <algorithm>
 #include <filesystem>
 // IDA SDK headers - must include pro.h before other IDA headers
 #include <pro.h>
@@ -12,29 +13,46 @@ namespace llm_re {
 // Global logger instance
 Logger g_logger;
 
+// Write a value in [0, 999] as zero-padded decimal digits
+static void write_digits(char* out, int value, int width) {
+    for (int i = width - 1; i >= 0; --i) {
+        out[i] = static_cast<char>('0' + value % 10);
+        value /= 10;
+    }
+}
+
 std::string Logger::get_timestamp() {
     auto now = std::chrono::system_clock::now();
     auto time_t = std::chrono::system_clock::to_time_t(now);
     auto ms = std::chrono::duration_cast<std::chrono::milliseconds>(
         now.time_since_epoch()) % 1000;
 
-    char time_buffer[32];
-    std::strftime(time_buffer, sizeof(time_buffer), "%H:%M:%S", std::localtime(&time_t));
-
-    // Build timestamp string
-    std::string result(time_buffer);
-    result += ".";
-
-    // Add milliseconds with padding
-    int ms_val = static_cast<int>(ms.count());
-    if (ms_val < 10) {
-        result += "00";
-    } else if (ms_val < 100) {
-        result += "0";
+    // Broken-down time only changes once per second, so cache "HH:MM:SS" per thread
+    // and skip localtime/strftime for every other message logged in that second
+    thread_local std::time_t cached_second = -1;
+    thread_local char cached_time[8];
+    if (time_t != cached_second) {
+        std::tm local_tm{};
+#ifdef _WIN32
+        localtime_s(&local_tm, &time_t);
+#else
+        localtime_r(&time_t, &local_tm);
+#endif
+        write_digits(cached_time, local_tm.tm_hour, 2);
+        cached_time[2] = ':';
+        write_digits(cached_time + 3, local_tm.tm_min, 2);
+        cached_time[5] = ':';
+        write_digits(cached_time + 6, local_tm.tm_sec, 2);
+        cached_second = time_t;
     }
-    result += std::to_string(ms_val);
 
-    return result;
+    // Build "HH:MM:SS.mmm"
+    char time_buffer[12];
+    std::copy(cached_time, cached_time + 8, time_buffer);
+    time_buffer[8] = '.';
+    write_digits(time_buffer + 9, static_cast<int>(ms.count()), 3);
+
+    return std::string(time_buffer, sizeof(time_buffer));
 }
 
 std::string Logger::level_to_string(claude::LogLevel level) {
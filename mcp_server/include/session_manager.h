@@ -9,6 +9,7 @@
 #include <condition_variable>
 #include <queue>
 #include <atomic>
+#include <cstdlib>
 #include <nlohmann/json.hpp>
 
 namespace llm_re::mcp {
@@ -18,6 +19,15 @@ using json = nlohmann::json;
 // Forward declaration
 class OrchestratorBridge;
 
+// Verbose protocol logging (full JSON dumps to stderr), enabled with IDA_SWARM_MCP_DEBUG=1
+inline bool debug_logging_enabled() {
+    static const bool enabled = [] {
+        const char* value = std::getenv("IDA_SWARM_MCP_DEBUG");
+        return value != nullptr && std::string(value) == "1";
+    }();
+    return enabled;
+}
+
 // Manages multiple orchestrator sessions for the MCP server
 class SessionManager {
 public:
@@ -29,6 +39,12 @@ public:
         bool active;
         int orchestrator_pid;
 
+        // Set once the orchestrator has been reaped; after that its PID may belong to an
+        // unrelated process and must never be probed or signalled again
+        std::mutex process_mutex;                // Protects: orchestrator_exited, orchestrator_exit_status
+        bool orchestrator_exited = false;
+        int orchestrator_exit_status = 0;        // waitpid() status, if we reaped it
+
         // Pipe-based communication (blocking I/O, no polling)
         std::string session_dir;           // /tmp/ida_swarm_sessions/{session_id}/
         std::string state_file;            // state.json
@@ -36,6 +52,7 @@ public:
         std::string response_pipe;         // response.pipe (Orchestrator → MCP)
         int request_pipe_fd = -1;          // File descriptor for writing requests (kept open)
         int response_pipe_fd = -1;         // File descriptor for reading responses (kept open)
+        std::mutex request_write_mutex;    // Serializes frames written to request_pipe_fd
 
         // Response buffer for wait_for_response()
         std::vector<json> response_buffer;       // Buffered responses from orchestrator
@@ -102,6 +119,10 @@ private:
     std::string ida_path_ = "/Applications/IDA Professional 9.0.app/Contents/MacOS/ida64";
     std::string sessions_root_dir_ = "/tmp/ida_swarm_sessions";
 
+    // Monotonic counter for orchestrator request IDs (unique across sessions and threads)
+    std::atomic<uint64_t> next_request_id_{1};
+    std::string next_request_id(const std::string& prefix);
+
     // Helper to generate unique session ID from binary path hash
     std::string generate_session_id(const std::string& binary_path);
 
@@ -112,6 +133,12 @@ private:
     int spawn_orchestrator(const std::string& binary_path, const std::string& session_id,
                           Session* session);
 
+    // Open the request pipe once the orchestrator opens its read end; fails if it exits first
+    int open_request_pipe(Session* session, std::string& error);
+
+    // Release a reader thread still blocked opening the response pipe (error paths)
+    void wake_reader_thread(Session* session);
+
     // Send JSON message to orchestrator via pipe (length-prefixed)
     bool send_json_to_orchestrator(Session* session, const json& msg);
 
@@ -122,11 +149,20 @@ private:
     // Waits for at least one response if buffer is empty, then returns buffered response
     json consume_all_responses(Session* session_ptr, int timeout_ms = -1);
 
-    // Check if orchestrator process is still running
-    bool is_orchestrator_alive(int pid) const;
+    // Check if a PID we did not spawn is running (stale state files only)
+    bool is_pid_alive(int pid) const;
+
+    // Check if session's orchestrator process is still running (reaps it once it exits)
+    bool is_orchestrator_alive(Session* session) const;
+
+    // Send a signal to the orchestrator unless it has already been reaped
+    bool signal_orchestrator(Session* session, int sig) const;
+
+    // Wait until the orchestrator process exits (true) or timeout_ms passes (false)
+    bool wait_for_orchestrator_exit(Session* session, int timeout_ms) const;
 
     // Kill orchestrator process
-    void kill_orchestrator(int pid);
+    void kill_orchestrator(Session* session);
 
     // Create session directory and pipes
     bool create_session_directory(Session* session);
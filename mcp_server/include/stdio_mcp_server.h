@@ -1,12 +1,18 @@
 #pragma once
 
 #include <string>
+#include <string_view>
 #include <map>
 #include <functional>
 #include <memory>
 #include <thread>
 #include <atomic>
+#include <mutex>
+#include <condition_variable>
 #include <optional>
+#include <future>
+#include <vector>
+#include <utility>
 #include <nlohmann/json.hpp>
 
 namespace llm_re::mcp {
@@ -51,24 +57,57 @@ private:
     std::string server_name_;
     std::string server_version_;
     std::map<std::string, Tool> tools_;
+    std::optional<json> tools_list_cache_;  // tools/list result, rebuilt when a tool is registered
     std::atomic<bool> should_stop_{false};
-    State state_{State::UNINITIALIZED};
+    std::atomic<State> state_{State::UNINITIALIZED};
+
+    // Serializes writes to stdout (tool calls respond from worker threads)
+    std::mutex output_mutex_;
+
+    // Tracks tool calls running on worker threads so start() can drain them before returning
+    std::mutex in_flight_mutex_;
+    std::condition_variable in_flight_cv_;
+    int in_flight_calls_ = 0;
 
     // Process a JSON-RPC message - returns optional response
     std::optional<json> process_message(const json& message);
 
     // Handle specific methods
     json handle_initialize(const json& params);
-    json handle_list_tools(const json& params);
+    const json& handle_list_tools(const json& params);
     json handle_call_tool(const json& params);
     json handle_ping();
     void handle_initialized_notification();
 
-    // Read a line from stdin
-    std::string read_line();
+    // Run a tools/call request on a worker thread so the read loop keeps serving requests
+    void dispatch_tool_call(const json& message);
+
+    // Wait for a batch's parallel tool calls on a worker thread, then write the batch response
+    void dispatch_batch(const json& batch,
+                        std::vector<std::optional<json>> results,
+                        std::vector<std::pair<size_t, std::future<std::optional<json>>>> pending_calls);
+
+    // Write the non-empty results of a batch as one JSON array
+    void write_batch_response(const std::vector<std::optional<json>>& results, bool flush);
+
+    // In-flight worker accounting (start() waits for these before returning)
+    void begin_in_flight();
+    void end_in_flight();
+
+    // Read a line from stdin; the view stays valid until the next read_line() call
+    std::string_view read_line();
+
+    // Buffered stdin state for read_line() (filled with large read() calls)
+    static constexpr size_t INPUT_CHUNK_SIZE = 64 * 1024;
+    std::string input_buffer_;
+    size_t input_offset_ = 0;
+    bool input_eof_ = false;
+
+    // Write JSON to stdout; the read loop defers the flush while pipelined input is pending
+    void write_json(const json& response, bool flush = true);
 
-    // Write JSON to stdout
-    void write_json(const json& response);
+    // Flush responses buffered by the read loop
+    void flush_output();
 
     // Create error response - id is optional for proper handling
     json create_error_response(const std::optional<json>& id, int code,
@@ -76,11 +115,12 @@ private:
                               const std::optional<json>& data = std::nullopt);
 
     // Create success response
-    json create_success_response(const json& id, const json& result);
+    json create_success_response(const json& id, json result);
 
     // Validation helpers
     bool is_notification(const json& message) const;
     bool is_batch_request(const json& message) const;
+    bool is_concurrent_tool_call(const json& message) const;
 };
 
 } // namespace llm_re::mcp
\ No newline at end of file
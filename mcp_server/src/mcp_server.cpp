@@ -50,6 +50,18 @@ bool MCPServer::initialize() {
     session_manager_->set_max_sessions(config_.max_sessions);
     session_manager_->set_ida_path(config_.ida_path);
 
+    // Surface a bad IDA path at startup instead of on the first start_analysis_session
+    // (non-throwing overload: an unreadable path must only warn, never abort startup)
+    std::error_code ida_path_error;
+    if (!fs::exists(config_.ida_path, ida_path_error)) {
+        std::cerr << "WARNING: IDA executable not found at: " << config_.ida_path;
+        if (ida_path_error) {
+            std::cerr << " (" << ida_path_error.message() << ")";
+        }
+        std::cerr << std::endl;
+        std::cerr << "  Sessions cannot be started until ida_path in ~/.ida_swarm_mcp/server_config.json is fixed" << std::endl;
+    }
+
     // Create MCP stdio server
     mcp_server_ = std::make_unique<StdioMCPServer>("IDA Swarm MCP Server", "1.0.0");
 
@@ -60,6 +72,11 @@ bool MCPServer::initialize() {
     std::signal(SIGINT, signal_handler);
     std::signal(SIGTERM, signal_handler);
 
+    // A crashed orchestrator leaves its request pipe without a reader; writing to it must
+    // fail with EPIPE (handled by send_json_to_orchestrator) instead of killing the server
+    // (spawn_orchestrator resets it to the default for IDA)
+    std::signal(SIGPIPE, SIG_IGN);
+
 
     std::cerr << "MCP Server initialized successfully" << std::endl;
     return true;
@@ -143,6 +160,16 @@ void MCPServer::register_tools() {
                                 "Background mode exists for parallel workflows, not to make slow operations fast.\n\n"
                                 "If run_in_background=true: Returns only session_id immediately. Use wait_for_response() "
                                 "to retrieve results later."}
+            }},
+            {"reuse_existing", {
+                {"type", "boolean"},
+                {"default", false},
+                {"description", "Whether to reuse an already running session for this binary instead of failing.\n\n"
+                                "DEFAULT (false): Errors if the binary already has an active session.\n\n"
+                                "If reuse_existing=true and a session is active for binary_path, the task is sent to that "
+                                "session's orchestrator as a message (same as send_message) and its session_id is returned. "
+                                "This skips launching IDA and re-loading the database. If no session is active, a new one "
+                                "is started as usual."}
             }}
         }},
         {"required", nlohmann::json::array({"binary_path", "task"})}
@@ -297,6 +324,7 @@ nlohmann::json MCPServer::handle_start_analysis_session(const nlohmann::json& pa
         std::string binary_path = params.at("binary_path");
         std::string task = params.at("task");
         bool run_in_background = params.value("run_in_background", false);
+        bool reuse_existing = params.value("reuse_existing", false);
 
         // Validate binary path
         if (!fs::exists(binary_path)) {
@@ -307,6 +335,33 @@ nlohmann::json MCPServer::handle_start_analysis_session(const nlohmann::json& pa
             };
         }
 
+        // Reuse a warm session for this binary instead of spinning up IDA again
+        if (reuse_existing) {
+            std::string existing_id = session_manager_->get_active_session_for_binary(binary_path);
+            if (!existing_id.empty()) {
+                std::cerr << "Reusing active session " << existing_id << " for: " << binary_path << std::endl;
+
+                nlohmann::json result = handle_send_message({
+                    {"session_id", existing_id},
+                    {"message", task},
+                    {"run_in_background", run_in_background}
+                });
+                if (result.value("isError", false)) {
+                    return result;
+                }
+
+                result["session_id"] = existing_id;
+                result["reused_session"] = true;
+                result["session_info"] = {
+                    {"session_id", existing_id},
+                    {"binary_path", binary_path},
+                    {"status", "active"},
+                    {"background", run_in_background}
+                };
+                return result;
+            }
+        }
+
         // No restriction on file type - IDA can handle both raw binaries and databases
 
         std::cerr << "Starting new analysis session for: " << binary_path << std::endl;
@@ -348,7 +403,9 @@ nlohmann::json MCPServer::handle_start_analysis_session(const nlohmann::json& pa
         // Wait for initial response from orchestrator
         nlohmann::json response = session_manager_->wait_for_response(session_id);
 
-        std::cerr << "Got initial response from orchestrator: " << response.dump(2) << std::endl;
+        if (debug_logging_enabled()) {
+            std::cerr << "Got initial response from orchestrator: " << response.dump(2) << std::endl;
+        }
 
         if (response.contains("error")) {
             // Clean up failed session
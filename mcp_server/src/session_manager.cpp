@@ -7,12 +7,15 @@
 #include <sys/types.h>
 #include <sys/stat.h>
 #include <sys/wait.h>
+#include <sys/uio.h>
+#include <poll.h>
 #include <signal.h>
 #include <fcntl.h>
 #include <filesystem>
 #include <cstring>
 #include <spawn.h>
 #include <algorithm>
+#include <string_view>
 #include <cctype>
 #include <openssl/sha.h>
 #include <errno.h>
@@ -24,6 +27,13 @@ namespace fs = std::filesystem;
 
 namespace llm_re::mcp {
 
+// How often the pipe reader wakes up to check reader_should_stop while idle
+static constexpr int READER_POLL_INTERVAL_MS = 250;
+
+// How long the pipe reader waits on EOF for the orchestrator to become reapable. A crashing
+// process closes its pipe ends before the kernel lets us reap it.
+static constexpr int EOF_EXIT_GRACE_MS = 2000;
+
 // Helper function to read exactly N bytes from a file descriptor
 // Handles partial reads and EINTR interrupts
 static ssize_t read_exactly(int fd, void* buf, size_t count) {
@@ -49,6 +59,34 @@ static ssize_t read_exactly(int fd, void* buf, size_t count) {
     return total;
 }
 
+// Helper function to write a set of buffers completely with writev
+// Handles partial writes and EINTR interrupts
+static bool write_all(int fd, struct iovec* iov, int iovcnt) {
+    while (iovcnt > 0) {
+        ssize_t n = writev(fd, iov, iovcnt);
+        if (n < 0) {
+            if (errno == EINTR) {
+                // Interrupted by signal, retry
+                continue;
+            }
+            // Real error
+            return false;
+        }
+
+        // Skip fully written buffers, then advance into the partially written one
+        while (iovcnt > 0 && static_cast<size_t>(n) >= iov->iov_len) {
+            n -= iov->iov_len;
+            ++iov;
+            --iovcnt;
+        }
+        if (iovcnt > 0) {
+            iov->iov_base = static_cast<char*>(iov->iov_base) + n;
+            iov->iov_len -= n;
+        }
+    }
+    return true;
+}
+
 SessionManager::SessionManager() {
     // Create root directory for session files if it doesn't exist
     fs::path sessions_dir = sessions_root_dir_;
@@ -90,6 +128,10 @@ std::string SessionManager::hash_binary_path(const std::string& binary_path) {
     return ss.str();
 }
 
+std::string SessionManager::next_request_id(const std::string& prefix) {
+    return prefix + "_" + std::to_string(next_request_id_++);
+}
+
 std::string SessionManager::generate_session_id(const std::string& binary_path) {
     // Hash the absolute binary path to create deterministic session ID
     std::string hash = hash_binary_path(binary_path);
@@ -133,6 +175,14 @@ std::string SessionManager::generate_session_id(const std::string& binary_path)
 std::string SessionManager::create_session(const std::string& binary_path, const std::string& initial_task) {
     std::lock_guard<std::mutex> lock(sessions_mutex_);
 
+    // Fail before touching session directories or pipes if IDA can't be launched at all
+    std::error_code ida_path_error;
+    if (!fs::exists(ida_path_, ida_path_error)) {
+        std::string reason = ida_path_error ? " (" + ida_path_error.message() + ")" : "";
+        throw std::runtime_error("IDA executable not found at: " + ida_path_ + reason +
+                                 " (set ida_path in ~/.ida_swarm_mcp/server_config.json)");
+    }
+
     // Generate session ID from binary path (deterministic)
     std::string session_id = generate_session_id(binary_path);
     fs::path session_dir = fs::path(sessions_root_dir_) / session_id;
@@ -153,7 +203,7 @@ std::string SessionManager::create_session(const std::string& binary_path, const
                 // Verify this is the same binary (not a collision)
                 if (stored_path == binary_path) {
                     // Check if orchestrator is still alive
-                    if (is_orchestrator_alive(pid)) {
+                    if (is_pid_alive(pid)) {
                         // Session is alive! Check if already in our map
                         auto it = sessions_.find(session_id);
                         if (it != sessions_.end()) {
@@ -224,7 +274,7 @@ std::string SessionManager::create_session(const std::string& binary_path, const
 
     // Update state file with PID
     if (!update_state_file(session.get())) {
-        kill_orchestrator(session->orchestrator_pid);
+        kill_orchestrator(session.get());
         cleanup_session_directory(session_id);
         throw std::runtime_error("Failed to write state file");
     }
@@ -234,21 +284,23 @@ std::string SessionManager::create_session(const std::string& binary_path, const
         &SessionManager::orchestrator_reader_thread, this, session.get()
     );
 
-    // Open request pipe for writing (blocks until orchestrator opens for reading)
+    // Open request pipe for writing (waits until orchestrator opens for reading)
     // CRITICAL: Keep this FD open for the entire session lifetime
-    std::cerr << "MCP Server: Opening request pipe (will block until orchestrator ready): "
+    std::cerr << "MCP Server: Opening request pipe (will wait until orchestrator ready): "
               << session->request_pipe << std::endl;
 
-    session->request_pipe_fd = open(session->request_pipe.c_str(), O_WRONLY);
+    std::string open_error;
+    session->request_pipe_fd = open_request_pipe(session.get(), open_error);
     if (session->request_pipe_fd < 0) {
-        std::cerr << "MCP Server: Failed to open request pipe: " << strerror(errno) << std::endl;
+        std::cerr << "MCP Server: Failed to open request pipe: " << open_error << std::endl;
         session->reader_should_stop = true;
+        wake_reader_thread(session.get());
         if (session->reader_thread && session->reader_thread->joinable()) {
             session->reader_thread->join();
         }
-        kill_orchestrator(session->orchestrator_pid);
+        kill_orchestrator(session.get());
         cleanup_session_directory(session_id);
-        throw std::runtime_error("Failed to open request pipe: " + std::string(strerror(errno)));
+        throw std::runtime_error("Failed to open request pipe: " + open_error);
     }
 
     std::cerr << "MCP Server: Request pipe opened (fd=" << session->request_pipe_fd << ")" << std::endl;
@@ -256,7 +308,7 @@ std::string SessionManager::create_session(const std::string& binary_path, const
     // Send initial task
     json init_msg;
     init_msg["type"] = "request";
-    init_msg["id"] = "init_" + session_id;
+    init_msg["id"] = next_request_id("init_" + session_id);
     init_msg["method"] = "start_task";
     init_msg["params"]["task"] = initial_task;
 
@@ -264,10 +316,11 @@ std::string SessionManager::create_session(const std::string& binary_path, const
         close(session->request_pipe_fd);
         session->request_pipe_fd = -1;
         session->reader_should_stop = true;
+        wake_reader_thread(session.get());
         if (session->reader_thread && session->reader_thread->joinable()) {
             session->reader_thread->join();
         }
-        kill_orchestrator(session->orchestrator_pid);
+        kill_orchestrator(session.get());
         cleanup_session_directory(session_id);
         throw std::runtime_error("Failed to send initial task to orchestrator");
     }
@@ -376,7 +429,7 @@ json SessionManager::send_message(const std::string& session_id, const std::stri
     // Create message for orchestrator
     json msg;
     msg["type"] = "request";
-    msg["id"] = "msg_" + std::to_string(std::chrono::steady_clock::now().time_since_epoch().count());
+    msg["id"] = next_request_id("msg");
     msg["method"] = "process_input";
     msg["params"]["input"] = message;
 
@@ -472,7 +525,7 @@ bool SessionManager::close_session(const std::string& session_id) {
     // Send shutdown message to orchestrator
     json shutdown_msg;
     shutdown_msg["type"] = "request";
-    shutdown_msg["id"] = "shutdown_" + session_id;
+    shutdown_msg["id"] = next_request_id("shutdown_" + session_id);
     shutdown_msg["method"] = "shutdown";
 
     std::cerr << "MCP Server: Sending shutdown message to orchestrator..." << std::endl;
@@ -483,7 +536,7 @@ bool SessionManager::close_session(const std::string& session_id) {
     int wait_seconds = 0;
     const int max_wait_seconds = 60;
 
-    while (wait_seconds < max_wait_seconds && is_orchestrator_alive(session->orchestrator_pid)) {
+    while (wait_seconds < max_wait_seconds && is_orchestrator_alive(session.get())) {
         std::this_thread::sleep_for(std::chrono::seconds(1));
         wait_seconds++;
         if (wait_seconds % 10 == 0) {
@@ -508,9 +561,9 @@ bool SessionManager::close_session(const std::string& session_id) {
     }
 
     // Only hard kill if process is still alive after graceful timeout
-    if (is_orchestrator_alive(session->orchestrator_pid)) {
+    if (is_orchestrator_alive(session.get())) {
         std::cerr << "MCP Server: Graceful exit timeout, using hard kill as last resort..." << std::endl;
-        kill_orchestrator(session->orchestrator_pid);
+        kill_orchestrator(session.get());
     } else {
         std::cerr << "MCP Server: Process exited gracefully" << std::endl;
     }
@@ -533,7 +586,6 @@ bool SessionManager::close_session(const std::string& session_id) {
 
 void SessionManager::close_all_sessions() {
     std::vector<Session*> sessions_to_close;
-    std::vector<int> pids_to_wait;
     std::vector<std::string> session_ids;
 
     // First pass: mark all sessions as inactive and collect pointers
@@ -542,7 +594,6 @@ void SessionManager::close_all_sessions() {
         for (auto& [session_id, session] : sessions_) {
             session->active = false;  // Reject new operations
             sessions_to_close.push_back(session.get());
-            pids_to_wait.push_back(session->orchestrator_pid);
             session_ids.push_back(session_id);
         }
     } // Release sessions_mutex_
@@ -566,7 +617,7 @@ void SessionManager::close_all_sessions() {
             // Send shutdown message
             json shutdown_msg;
             shutdown_msg["type"] = "request";
-            shutdown_msg["id"] = "shutdown_all";
+            shutdown_msg["id"] = next_request_id("shutdown_" + session_id);
             shutdown_msg["method"] = "shutdown";
 
             send_json_to_orchestrator(session.get(), shutdown_msg);
@@ -584,8 +635,8 @@ void SessionManager::close_all_sessions() {
     while (true) {
         // Check if all processes have exited
         bool all_exited = true;
-        for (int pid : pids_to_wait) {
-            if (is_orchestrator_alive(pid)) {
+        for (Session* session : sessions_to_close) {
+            if (is_orchestrator_alive(session)) {
                 all_exited = false;
                 break;
             }
@@ -608,8 +659,8 @@ void SessionManager::close_all_sessions() {
         // Progress update every 10 seconds
         if (elapsed > 0 && elapsed % 10 == 0) {
             int still_alive = 0;
-            for (int pid : pids_to_wait) {
-                if (is_orchestrator_alive(pid)) still_alive++;
+            for (Session* session : sessions_to_close) {
+                if (is_orchestrator_alive(session)) still_alive++;
             }
             std::cerr << "MCP Server: Still waiting for " << still_alive << " process(es) to exit ("
                       << elapsed << "s elapsed)..." << std::endl;
@@ -639,10 +690,10 @@ void SessionManager::close_all_sessions() {
             }
 
             // Kill any remaining processes
-            if (is_orchestrator_alive(session->orchestrator_pid)) {
+            if (is_orchestrator_alive(session.get())) {
                 std::cerr << "MCP Server: Force-killing session " << session_id
                           << " (PID " << session->orchestrator_pid << ")" << std::endl;
-                kill_orchestrator(session->orchestrator_pid);
+                kill_orchestrator(session.get());
             }
 
             // Cleanup pipes and session directory
@@ -675,10 +726,10 @@ void SessionManager::force_kill_all_sessions() {
             session->response_pipe_fd = -1;
         }
 
-        if (is_orchestrator_alive(session->orchestrator_pid)) {
+        if (is_orchestrator_alive(session.get())) {
             std::cerr << "MCP Server: Force-killing session " << session_id
                       << " (PID " << session->orchestrator_pid << ")" << std::endl;
-            kill(session->orchestrator_pid, SIGKILL);
+            signal_orchestrator(session.get(), SIGKILL);
         }
 
         // Detach reader thread instead of joining (we're in a hurry)
@@ -712,7 +763,7 @@ json SessionManager::get_session_status(const std::string& session_id) const {
     status["binary_path"] = session->binary_path;
     status["active"] = session->active;
     status["pid"] = session->orchestrator_pid;
-    status["process_alive"] = is_orchestrator_alive(session->orchestrator_pid);
+    status["process_alive"] = is_orchestrator_alive(session.get());
 
     auto now = std::chrono::steady_clock::now();
     auto created_seconds = std::chrono::duration_cast<std::chrono::seconds>(
@@ -784,12 +835,8 @@ int SessionManager::spawn_orchestrator(const std::string& binary_path, const std
     std::cerr << "  IDA_SWARM_MCP_SESSION_ID=" << session_id << std::endl;
     std::cerr << "  IDA_SWARM_MCP_SESSION_DIR=" << session->session_dir << std::endl;
 
-    // Use posix_spawn to launch IDA directly
+    // Use posix_spawn to launch IDA directly (existence checked up front in create_session)
     std::string ida_exe = ida_path_;
-    if (!fs::exists(ida_exe)) {
-        std::cerr << "IDA executable not found at: " << ida_exe << std::endl;
-        return -1;
-    }
 
     // Build stable argv array - need to keep strings alive during posix_spawn
     std::vector<std::string> stable_args;
@@ -817,8 +864,27 @@ int SessionManager::spawn_orchestrator(const std::string& binary_path, const std
     std::cerr << "  Binary: " << binary_path << std::endl;
     std::cerr << "  Session: " << session_id << std::endl;
 
+    // Keep IDA off our stdio: stdin/stdout carry the MCP JSON-RPC stream, so give it
+    // /dev/null for input and send anything it prints to our stderr instead
+    posix_spawn_file_actions_t file_actions;
+    posix_spawn_file_actions_init(&file_actions);
+    posix_spawn_file_actions_addopen(&file_actions, STDIN_FILENO, "/dev/null", O_RDONLY, 0);
+    posix_spawn_file_actions_adddup2(&file_actions, STDERR_FILENO, STDOUT_FILENO);
+
+    // The server ignores SIGPIPE (see MCPServer::initialize); IDA must start with the default
+    // disposition rather than inherit the ignore
+    posix_spawnattr_t attr;
+    posix_spawnattr_init(&attr);
+    sigset_t default_signals;
+    sigemptyset(&default_signals);
+    sigaddset(&default_signals, SIGPIPE);
+    posix_spawnattr_setsigdefault(&attr, &default_signals);
+    posix_spawnattr_setflags(&attr, POSIX_SPAWN_SETSIGDEF);
+
     pid_t pid;
-    int result = posix_spawn(&pid, ida_exe.c_str(), nullptr, nullptr, argv.data(), custom_env.data());
+    int result = posix_spawn(&pid, ida_exe.c_str(), &file_actions, &attr, argv.data(), custom_env.data());
+    posix_spawn_file_actions_destroy(&file_actions);
+    posix_spawnattr_destroy(&attr);
 
     if (result != 0) {
         std::cerr << "posix_spawn failed: " << strerror(result) << std::endl;
@@ -829,6 +895,55 @@ int SessionManager::spawn_orchestrator(const std::string& binary_path, const std
     return pid;
 }
 
+int SessionManager::open_request_pipe(Session* session, std::string& error) {
+    // A plain O_WRONLY open blocks until IDA opens the read end, forever if IDA dies
+    // during startup. O_NONBLOCK fails with ENXIO while there is no reader, so poll
+    // the open and check the process in between; the open itself is the ready signal.
+    while (true) {
+        int fd = open(session->request_pipe.c_str(), O_WRONLY | O_NONBLOCK | O_CLOEXEC);
+        if (fd >= 0) {
+            // Back to blocking writes for the session lifetime
+            int flags = fcntl(fd, F_GETFL);
+            if (flags < 0 || fcntl(fd, F_SETFL, flags & ~O_NONBLOCK) < 0) {
+                error = strerror(errno);
+                close(fd);
+                return -1;
+            }
+            return fd;
+        }
+
+        if (errno != ENXIO && errno != EINTR) {
+            error = strerror(errno);
+            return -1;
+        }
+
+        if (!is_orchestrator_alive(session)) {
+            error = "orchestrator process (PID " + std::to_string(session->orchestrator_pid) +
+                    ") exited before opening the pipe";
+            return -1;
+        }
+
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    }
+}
+
+void SessionManager::wake_reader_thread(Session* session) {
+    // The reader may still be blocked in open(O_RDONLY) on the response pipe waiting for
+    // a writer that will never come. Briefly becoming that writer releases it; it then
+    // sees EOF and exits. Retry for a moment in case the thread hasn't reached open() yet.
+    for (int attempt = 0; attempt < 20; ++attempt) {
+        int fd = open(session->response_pipe.c_str(), O_WRONLY | O_NONBLOCK);
+        if (fd >= 0) {
+            close(fd);
+            return;
+        }
+        if (errno != ENXIO && errno != EINTR) {
+            return;  // Pipe gone - nothing to wake
+        }
+        std::this_thread::sleep_for(std::chrono::milliseconds(50));
+    }
+}
+
 bool SessionManager::send_json_to_orchestrator(Session* session, const json& msg) {
     if (!session || session->request_pipe_fd < 0) {
         std::cerr << "Invalid session or pipe not open" << std::endl;
@@ -842,15 +957,18 @@ bool SessionManager::send_json_to_orchestrator(Session* session, const json& msg
 
         // Write length-prefixed message to the EXISTING open FD
         // CRITICAL: Do NOT close this FD - it stays open for the session lifetime
-        ssize_t n = write(session->request_pipe_fd, &len, sizeof(len));
-        if (n != sizeof(len)) {
-            std::cerr << "Failed to write message length to pipe: " << strerror(errno) << std::endl;
-            return false;
-        }
-
-        n = write(session->request_pipe_fd, json_str.c_str(), len);
-        if (n != static_cast<ssize_t>(len)) {
-            std::cerr << "Failed to write message body to pipe: " << strerror(errno) << std::endl;
+        // Prefix and body go out in one writev (write_all retries partial writes and EINTR).
+        // Frames larger than PIPE_BUF are not written atomically, so concurrent senders are
+        // serialized to keep frames from interleaving.
+        struct iovec iov[2];
+        iov[0].iov_base = &len;
+        iov[0].iov_len = sizeof(len);
+        iov[1].iov_base = json_str.data();
+        iov[1].iov_len = len;
+
+        std::lock_guard<std::mutex> write_lock(session->request_write_mutex);
+        if (!write_all(session->request_pipe_fd, iov, 2)) {
+            std::cerr << "Failed to write message to pipe: " << strerror(errno) << std::endl;
             return false;
         }
 
@@ -866,7 +984,9 @@ void SessionManager::orchestrator_reader_thread(Session* session) {
     std::cerr << "MCP Server: Opening response pipe: " << session->response_pipe << std::endl;
 
     // Open pipe for reading (blocks until orchestrator opens for writing)
-    int fd = open(session->response_pipe.c_str(), O_RDONLY);
+    // O_CLOEXEC on both session pipes: IDA instances spawned for other sessions must not
+    // inherit them, or this session would never see EOF when its own orchestrator exits
+    int fd = open(session->response_pipe.c_str(), O_RDONLY | O_CLOEXEC);
     if (fd < 0) {
         std::cerr << "MCP Server: Failed to open response pipe: " << strerror(errno) << std::endl;
 
@@ -886,8 +1006,24 @@ void SessionManager::orchestrator_reader_thread(Session* session) {
 
     std::cerr << "MCP Server: Response pipe opened, waiting for messages..." << std::endl;
 
+    // Message body buffer, reused across frames so steady-state reads don't allocate
+    std::vector<char> buf;
+
     while (!session->reader_should_stop) {
-        // Read message length (blocks until data available)
+        // Wait for the next frame with poll() so a stop request is noticed even if the
+        // orchestrator is hung and never writes or closes its end of the pipe
+        struct pollfd pfd;
+        pfd.fd = fd;
+        pfd.events = POLLIN;
+        pfd.revents = 0;
+
+        int ready = poll(&pfd, 1, READER_POLL_INTERVAL_MS);
+        if (ready == 0 || (ready < 0 && errno == EINTR)) {
+            continue;  // Timeout or signal - re-check reader_should_stop
+        }
+        // Data, hangup or error: the read below reports which
+
+        // Read message length
         uint32_t len;
         ssize_t n = read_exactly(fd, &len, sizeof(len));
 
@@ -895,19 +1031,29 @@ void SessionManager::orchestrator_reader_thread(Session* session) {
             // EOF - orchestrator closed pipe (clean shutdown or crash)
             std::cerr << "MCP Server: Orchestrator closed pipe (EOF detected)" << std::endl;
 
-            // Check if process actually died
-            if (!is_orchestrator_alive(session->orchestrator_pid)) {
+            // Check if process actually died (give it a moment to become reapable)
+            bool died = !session->reader_should_stop &&
+                        wait_for_orchestrator_exit(session, EOF_EXIT_GRACE_MS);
+
+            if (died) {
                 std::cerr << "MCP Server: Orchestrator process died (PID "
                           << session->orchestrator_pid << ")" << std::endl;
+            }
 
-                json crash_response;
-                crash_response["error"] = "Orchestrator process terminated (PID " +
-                                          std::to_string(session->orchestrator_pid) + ")";
-                {
-                    std::lock_guard<std::mutex> lock(session->state_mutex);
+            // A pending request will never get its response once the pipe is closed, so
+            // answer it with an error whatever the process state
+            {
+                std::lock_guard<std::mutex> lock(session->state_mutex);
+                if (died || session->has_pending_request) {
+                    json crash_response;
+                    crash_response["error"] = died
+                        ? "Orchestrator process terminated (PID " + std::to_string(session->orchestrator_pid) + ")"
+                        : "Orchestrator closed its pipe (PID " + std::to_string(session->orchestrator_pid) + ")";
                     session->response_buffer.push_back(crash_response);
                 }
-                session->response_cv.notify_all();
+            }
+            session->response_cv.notify_all();
+            if (died) {
                 session->active = false;
             }
             break;
@@ -933,8 +1079,8 @@ void SessionManager::orchestrator_reader_thread(Session* session) {
             break;
         }
 
-        // Read message body
-        std::vector<char> buf(len);
+        // Read message body (resize keeps capacity from earlier, larger frames)
+        buf.resize(len);
         n = read_exactly(fd, buf.data(), len);
 
         if (n != static_cast<ssize_t>(len)) {
@@ -955,8 +1101,14 @@ void SessionManager::orchestrator_reader_thread(Session* session) {
         try {
             json response = json::parse(buf.begin(), buf.end());
 
-            std::cerr << "MCP Server: Received response from orchestrator: "
-                      << response.dump().substr(0, 200) << "..." << std::endl;
+            // Preview straight from the wire bytes; only re-serialize the whole message in debug mode
+            if (debug_logging_enabled()) {
+                std::cerr << "MCP Server: Received response from orchestrator: "
+                          << response.dump(2) << std::endl;
+            } else {
+                std::cerr << "MCP Server: Received response from orchestrator (" << len << " bytes): "
+                          << std::string_view(buf.data(), std::min<size_t>(len, 200)) << "..." << std::endl;
+            }
 
             // Add to buffer
             {
@@ -984,31 +1136,81 @@ void SessionManager::orchestrator_reader_thread(Session* session) {
     std::cerr << "MCP Server: Reader thread exiting for session " << session->session_id << std::endl;
 }
 
-bool SessionManager::is_orchestrator_alive(int pid) const {
+bool SessionManager::is_pid_alive(int pid) const {
     if (pid <= 0) return false;
 
-    // Check if process exists
+    // Only for PIDs we did not spawn (e.g. from a stale state file)
     int result = kill(pid, 0);
     return (result == 0);
 }
 
-void SessionManager::kill_orchestrator(int pid) {
-    if (pid <= 0) return;
+bool SessionManager::is_orchestrator_alive(Session* session) const {
+    std::lock_guard<std::mutex> lock(session->process_mutex);
+    if (session->orchestrator_exited || session->orchestrator_pid <= 0) {
+        return false;
+    }
+
+    // Orchestrators we spawned are our children: reap them here, otherwise an exited
+    // IDA stays a zombie and would keep being reported as alive
+    int status;
+    pid_t reaped = waitpid(session->orchestrator_pid, &status, WNOHANG);
+    if (reaped == 0 || (reaped < 0 && errno == EINTR)) {
+        return true;   // Still running
+    }
+
+    // Reaped just now (or ECHILD: already reaped). The PID is no longer ours and may be
+    // reused by an unrelated process, so it must never be probed or signalled again
+    session->orchestrator_exited = true;
+    if (reaped == session->orchestrator_pid) {
+        session->orchestrator_exit_status = status;
+    }
+    return false;
+}
+
+bool SessionManager::signal_orchestrator(Session* session, int sig) const {
+    // Holding process_mutex means the child can't be reaped (and its PID recycled)
+    // between the exited check and the kill
+    std::lock_guard<std::mutex> lock(session->process_mutex);
+    if (session->orchestrator_exited || session->orchestrator_pid <= 0) {
+        return false;
+    }
+    kill(session->orchestrator_pid, sig);
+    return true;
+}
+
+bool SessionManager::wait_for_orchestrator_exit(Session* session, int timeout_ms) const {
+    auto deadline = std::chrono::steady_clock::now() + std::chrono::milliseconds(timeout_ms);
 
-    // First try SIGTERM
-    kill(pid, SIGTERM);
+    while (is_orchestrator_alive(session)) {
+        if (std::chrono::steady_clock::now() >= deadline) {
+            return false;
+        }
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+    }
+    return true;
+}
 
-    // Wait a bit for graceful shutdown
-    std::this_thread::sleep_for(std::chrono::seconds(20));
+void SessionManager::kill_orchestrator(Session* session) {
+    // First try SIGTERM (nothing to do if it already exited and was reaped)
+    if (!signal_orchestrator(session, SIGTERM)) {
+        return;
+    }
 
+    // Give it up to 20s for graceful shutdown, returning as soon as it exits
     // If still alive, use SIGKILL
-    if (is_orchestrator_alive(pid)) {
-        kill(pid, SIGKILL);
+    if (!wait_for_orchestrator_exit(session, 20000)) {
+        signal_orchestrator(session, SIGKILL);
     }
 
     // Wait for process to be reaped
-    int status;
-    waitpid(pid, &status, 0);
+    std::lock_guard<std::mutex> lock(session->process_mutex);
+    if (!session->orchestrator_exited) {
+        int status;
+        if (waitpid(session->orchestrator_pid, &status, 0) == session->orchestrator_pid) {
+            session->orchestrator_exit_status = status;
+        }
+        session->orchestrator_exited = true;
+    }
 }
 
 bool SessionManager::create_session_directory(Session* session) {
@@ -1,6 +1,14 @@
 #include "../include/stdio_mcp_server.h"
 #include <iostream>
 #include <string>
+#include <string_view>
+#include <thread>
+#include <future>
+#include <vector>
+#include <memory>
+#include <system_error>
+#include <unistd.h>
+#include <errno.h>
 
 namespace llm_re::mcp {
 
@@ -25,25 +33,30 @@ void StdioMCPServer::register_tool(const std::string& name,
     tool.input_schema = input_schema;
     tool.handler = handler;
     tools_[name] = tool;
+    tools_list_cache_.reset();
 }
 
 void StdioMCPServer::start() {
+    // std::cerr is tied to std::cout by default, so every log line would flush stdout
+    // (from worker threads too, outside output_mutex_). Flushing is done explicitly instead.
+    std::cerr.tie(nullptr);
+
     while (!should_stop_) {
         try {
-            // Read JSON-RPC message from stdin
-            std::string line = read_line();
-            if (line.empty() && std::cin.eof()) {
+            // Read JSON-RPC message from stdin (view into the input buffer, parsed in place)
+            std::string_view line = read_line();
+            if (line.empty() && input_eof_) {
                 break;  // EOF reached
             }
 
             // Parse JSON
             json message;
             try {
-                message = json::parse(line);
+                message = json::parse(line.begin(), line.end());
             } catch (const json::exception& e) {
                 // Invalid JSON, send parse error
                 std::optional<json> no_id;
-                write_json(create_error_response(no_id, -32700, "Parse error"));
+                write_json(create_error_response(no_id, -32700, "Parse error"), false);
                 continue;
             }
 
@@ -61,27 +74,48 @@ void StdioMCPServer::start() {
                 if (has_initialize) {
                     std::optional<json> no_id;
                     write_json(create_error_response(no_id, -32600,
-                        "Invalid Request: initialize cannot be part of a batch"));
+                        "Invalid Request: initialize cannot be part of a batch"), false);
                     continue;
                 }
 
-                // Process each request in batch
-                json responses = json::array();
-                for (const auto& req : message) {
-                    auto response = process_message(req);
-                    if (response.has_value()) {
-                        responses.push_back(response.value());
+                // Process each request in batch - tool calls run in parallel, everything
+                // else in order on this thread; responses keep the batch order
+                std::vector<std::optional<json>> batch_results(message.size());
+                std::vector<std::pair<size_t, std::future<std::optional<json>>>> pending_calls;
+                for (size_t i = 0; i < message.size(); ++i) {
+                    const json& req = message[i];
+                    if (is_concurrent_tool_call(req)) {
+                        try {
+                            pending_calls.emplace_back(i, std::async(std::launch::async, [this, req]() {
+                                return process_message(req);
+                            }));
+                        } catch (const std::system_error& e) {
+                            // Could not start a worker thread - answer this entry, keep the rest
+                            std::cerr << "Failed to start batched tool call: " << e.what() << std::endl;
+                            batch_results[i] = create_error_response(req["id"], -32603,
+                                std::string("Internal error: ") + e.what());
+                        }
+                    } else {
+                        batch_results[i] = process_message(req);
                     }
                 }
 
-                if (!responses.empty()) {
-                    write_json(responses);
+                if (pending_calls.empty()) {
+                    write_batch_response(batch_results, false);
+                } else {
+                    // Collect tool call results on a worker thread so the read loop keeps
+                    // serving requests while the slowest call in the batch is running
+                    dispatch_batch(message, std::move(batch_results), std::move(pending_calls));
                 }
+            } else if (is_concurrent_tool_call(message)) {
+                // Tool calls can block for a long time (orchestrator analysis), so run them
+                // off the read loop and let other requests be served while they are in flight
+                dispatch_tool_call(message);
             } else {
                 // Process single message
                 auto response = process_message(message);
                 if (response.has_value()) {
-                    write_json(response.value());
+                    write_json(response.value(), false);
                 }
             }
 
@@ -89,6 +123,112 @@ void StdioMCPServer::start() {
             std::cerr << "Server error: " << e.what() << std::endl;
         }
     }
+
+    flush_output();
+
+    // Wait for in-flight tool calls so their responses are written before we return
+    std::unique_lock<std::mutex> lock(in_flight_mutex_);
+    in_flight_cv_.wait(lock, [this]() { return in_flight_calls_ == 0; });
+}
+
+void StdioMCPServer::begin_in_flight() {
+    std::lock_guard<std::mutex> lock(in_flight_mutex_);
+    in_flight_calls_++;
+}
+
+void StdioMCPServer::end_in_flight() {
+    std::lock_guard<std::mutex> lock(in_flight_mutex_);
+    if (--in_flight_calls_ == 0) {
+        in_flight_cv_.notify_all();
+    }
+}
+
+void StdioMCPServer::dispatch_tool_call(const json& message) {
+    begin_in_flight();
+
+    try {
+        std::thread([this, message]() {
+            try {
+                std::optional<json> response;
+                try {
+                    response = process_message(message);
+                } catch (const std::exception& e) {
+                    std::cerr << "Server error in tool call: " << e.what() << std::endl;
+                    response = create_error_response(message["id"], -32603,
+                        std::string("Internal error: ") + e.what());
+                }
+
+                if (response.has_value()) {
+                    write_json(response.value());
+                }
+            } catch (const std::exception& e) {
+                std::cerr << "Server error writing tool call response: " << e.what() << std::endl;
+            }
+
+            end_in_flight();
+        }).detach();
+    } catch (const std::system_error& e) {
+        // Could not start a worker thread (e.g. thread limit reached)
+        end_in_flight();
+        std::cerr << "Failed to start tool call thread: " << e.what() << std::endl;
+        write_json(create_error_response(message["id"], -32603,
+            std::string("Internal error: ") + e.what()), false);
+    }
+}
+
+void StdioMCPServer::dispatch_batch(const json& batch,
+                                    std::vector<std::optional<json>> results,
+                                    std::vector<std::pair<size_t, std::future<std::optional<json>>>> pending_calls) {
+    // Shared so the work is still available if the worker thread cannot be started
+    auto batch_results = std::make_shared<std::vector<std::optional<json>>>(std::move(results));
+    auto batch_calls = std::make_shared<std::vector<std::pair<size_t, std::future<std::optional<json>>>>>(
+        std::move(pending_calls));
+
+    auto collect = [this, batch, batch_results, batch_calls]() {
+        for (auto& [index, future] : *batch_calls) {
+            try {
+                (*batch_results)[index] = future.get();
+            } catch (const std::exception& e) {
+                // One failing call must not drop the rest of the batch
+                std::cerr << "Server error in batched tool call: " << e.what() << std::endl;
+                (*batch_results)[index] = create_error_response(batch[index]["id"], -32603,
+                    std::string("Internal error: ") + e.what());
+            }
+        }
+
+        try {
+            write_batch_response(*batch_results, true);
+        } catch (const std::exception& e) {
+            std::cerr << "Server error writing batch response: " << e.what() << std::endl;
+        }
+    };
+
+    begin_in_flight();
+
+    try {
+        std::thread([this, collect]() {
+            collect();
+            end_in_flight();
+        }).detach();
+    } catch (const std::system_error& e) {
+        // Could not start a worker thread - fall back to collecting on the read loop
+        end_in_flight();
+        std::cerr << "Failed to start batch thread: " << e.what() << std::endl;
+        collect();
+    }
+}
+
+void StdioMCPServer::write_batch_response(const std::vector<std::optional<json>>& results, bool flush) {
+    json responses = json::array();
+    for (const auto& response : results) {
+        if (response.has_value()) {
+            responses.push_back(response.value());
+        }
+    }
+
+    if (!responses.empty()) {
+        write_json(responses, flush);
+    }
 }
 
 void StdioMCPServer::stop() {
@@ -192,7 +332,7 @@ std::optional<json> StdioMCPServer::process_message(const json& message) {
             }
             return create_error_response(id, -32603, error_msg);
         }
-        return create_success_response(id.value(), result);
+        return create_success_response(id.value(), std::move(result));
     } else {
         if (!is_notif) {
             return create_error_response(id, -32601, "Method not found: " + method);
@@ -224,7 +364,12 @@ json StdioMCPServer::handle_initialize(const json& params) {
     return result;
 }
 
-json StdioMCPServer::handle_list_tools(const json& params) {
+const json& StdioMCPServer::handle_list_tools(const json& params) {
+    // Tool specs (long descriptions and schemas) never change after registration
+    if (tools_list_cache_.has_value()) {
+        return *tools_list_cache_;
+    }
+
     json result;
     json tools_array = json::array();
 
@@ -236,8 +381,9 @@ json StdioMCPServer::handle_list_tools(const json& params) {
         tools_array.push_back(tool_obj);
     }
 
-    result["tools"] = tools_array;
-    return result;
+    result["tools"] = std::move(tools_array);
+    tools_list_cache_ = std::move(result);
+    return *tools_list_cache_;
 }
 
 json StdioMCPServer::handle_call_tool(const json& params) {
@@ -326,20 +472,67 @@ void StdioMCPServer::handle_initialized_notification() {
     std::cerr << "Server initialized and ready for tool calls" << std::endl;
 }
 
-std::string StdioMCPServer::read_line() {
-    std::string line;
-    std::getline(std::cin, line);
-    return line;
+std::string_view StdioMCPServer::read_line() {
+    // Pull stdin in 64 KiB chunks and split lines out of our own buffer, so a large
+    // request costs a handful of read() calls instead of per-character stream reads.
+    // Lines are handed out as views (no copy); the buffer is only compacted on the
+    // next refill, after the caller is done with the previous line.
+    while (true) {
+        size_t newline = input_buffer_.find('\n', input_offset_);
+        if (newline != std::string::npos) {
+            std::string_view line(input_buffer_.data() + input_offset_, newline - input_offset_);
+            input_offset_ = newline + 1;
+            return line;
+        }
+
+        if (input_eof_) {
+            // Return a trailing line without newline (like std::getline), then empty
+            std::string_view line(input_buffer_.data() + input_offset_, input_buffer_.size() - input_offset_);
+            input_offset_ = input_buffer_.size();
+            return line;
+        }
+
+        // Drop consumed bytes before appending the next chunk
+        input_buffer_.erase(0, input_offset_);
+        input_offset_ = 0;
+
+        // Every pipelined request has been handled - push out their responses in one go
+        // before blocking for more input
+        flush_output();
+
+        char chunk[INPUT_CHUNK_SIZE];
+        ssize_t n = read(STDIN_FILENO, chunk, sizeof(chunk));
+        if (n < 0 && errno == EINTR) {
+            continue;
+        }
+        if (n <= 0) {
+            input_eof_ = true;
+            continue;
+        }
+        input_buffer_.append(chunk, n);
+    }
 }
 
-void StdioMCPServer::write_json(const json& response) {
+void StdioMCPServer::write_json(const json& response, bool flush) {
     // Only write non-empty responses
     if (!response.is_null() && !response.empty()) {
-        std::cout << response.dump() << std::endl;
-        std::cout.flush();
+        // Serialize outside the lock and emit the whole line at once
+        std::string line = response.dump();
+        line += '\n';
+
+        std::lock_guard<std::mutex> lock(output_mutex_);
+        std::cout.write(line.data(), line.size());
+        if (flush) {
+            std::cout.flush();
+        }
     }
 }
 
+void StdioMCPServer::flush_output() {
+    std::lock_guard<std::mutex> lock(output_mutex_);
+    std::cout.flush();
+}
+
 json StdioMCPServer::create_error_response(const std::optional<json>& id, int code,
                                           const std::string& message,
                                           const std::optional<json>& data) {
@@ -364,11 +557,11 @@ json StdioMCPServer::create_error_response(const std::optional<json>& id, int co
     return response;
 }
 
-json StdioMCPServer::create_success_response(const json& id, const json& result) {
+json StdioMCPServer::create_success_response(const json& id, json result) {
     json response;
     response["jsonrpc"] = "2.0";
     response["id"] = id;
-    response["result"] = result;
+    response["result"] = std::move(result);
     return response;
 }
 
@@ -380,4 +573,15 @@ bool StdioMCPServer::is_batch_request(const json& message) const {
     return message.is_array();
 }
 
+bool StdioMCPServer::is_concurrent_tool_call(const json& message) const {
+    // Only well-formed tools/call requests after initialization; everything else
+    // (including error responses for bad calls) stays on the read loop.
+    // Compare json values directly: value<std::string>() would throw on non-string fields
+    return message.is_object() &&
+           message.contains("id") &&
+           message.contains("jsonrpc") && message["jsonrpc"] == "2.0" &&
+           message.contains("method") && message["method"] == "tools/call" &&
+           state_ == State::INITIALIZED;
+}
+
 } // namespace llm_re::mcp
\ No newline at end of file
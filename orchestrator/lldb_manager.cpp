@@ -1338,14 +1338,14 @@ std::string LLDBSessionManager::read_from_lldb_until_prompt(int pty_fd, int time
 
 std::string LLDBSessionManager::strip_ansi_codes(const std::string& input) const {
     // Remove ANSI escape sequences: \x1b[...m
-    std::regex ansi_regex("\x1b\\[[0-9;]*m");
+    static const std::regex ansi_regex("\x1b\\[[0-9;]*m");
     return std::regex_replace(input, ansi_regex, "");
 }
 
 std::optional<uint64_t> LLDBSessionManager::parse_image_base_from_lldb_output(const std::string& output) const {
     // Parse output like:
     // [  0] 8A6E4F2A-0000-0000-0000-000000000000 0x000000010abcd000 /path/to/binary
-    std::regex base_regex(R"(\[\s*0\]\s+[0-9A-Fa-f-]+\s+(0x[0-9A-Fa-f]+))");
+    static const std::regex base_regex(R"(\[\s*0\]\s+[0-9A-Fa-f-]+\s+(0x[0-9A-Fa-f]+))");
     std::smatch match;
 
     if (std::regex_search(output, match, base_regex)) {
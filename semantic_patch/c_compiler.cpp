@@ -347,7 +347,7 @@ std::vector<std::string> CCompiler::parse_undefined_symbols(const std::string& c
     std::set<std::string> unique_symbols;  // Avoid duplicates
 
     // Regex patterns for different compilers
-    std::vector<std::regex> patterns = {
+    static const std::vector<std::regex> patterns = {
         // Clang: "error: use of undeclared identifier 'foo'"
         std::regex(R"(undeclared identifier '([^']+)')"),
         // GCC: "error: 'foo' undeclared"
@@ -378,7 +378,7 @@ std::vector<std::string> CCompiler::parse_undefined_types(const std::string& com
     std::set<std::string> unique_types;  // Avoid duplicates
 
     // Regex patterns for type errors
-    std::vector<std::regex> patterns = {
+    static const std::vector<std::regex> patterns = {
         // Clang/GCC: "error: unknown type name 'foo'"
         std::regex(R"(unknown type name '([^']+)')"),
         // Clang/GCC: "error: use of undeclared identifier 'struct foo'"
@@ -471,7 +471,7 @@ std::vector<std::string> CCompiler::parse_string_literals(const std::string& c_c
     // Match string literals: "string" (handle escaped quotes and other escape sequences)
     // This regex matches: " followed by any number of (non-quote-non-backslash OR backslash-anything) then "
     // Using custom delimiter to avoid conflicts with parentheses in regex
-    std::regex string_pattern(R"DELIM("([^"\\]*(\\.[^"\\]*)*)")DELIM");
+    static const std::regex string_pattern(R"DELIM("([^"\\]*(\\.[^"\\]*)*)")DELIM");
 
     auto begin = std::sregex_iterator(c_code.begin(), c_code.end(), string_pattern);
     auto end = std::sregex_iterator();
@@ -596,7 +596,7 @@ std::vector<std::string> CCompiler::extract_type_dependencies(const std::string&
     std::set<std::string> unique_deps;
 
     // Regex patterns to find type references in C definitions
-    std::vector<std::regex> patterns = {
+    static const std::vector<std::regex> patterns = {
         // "struct foo" or "union foo" or "enum foo"
         std::regex(R"(\b(?:struct|union|enum)\s+([a-zA-Z_][a-zA-Z0-9_]*)\b)"),
         // Typedef references (harder to detect, look for known type patterns)
@@ -758,7 +758,7 @@ std::vector<CCompiler::ParsedError> CCompiler::parse_compiler_errors(const std::
             if (line.find("undeclared") != std::string::npos) {
                 err.type = "undefined";
                 // Extract symbol name
-                std::regex symbol_regex("'([^']+)'");
+                static const std::regex symbol_regex("'([^']+)'");
                 std::smatch match;
                 if (std::regex_search(line, match, symbol_regex)) {
                     err.symbol = match[1].str();